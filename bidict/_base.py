@@ -28,12 +28,13 @@
 
 """Provides :class:`BidictBase`."""
 
-from collections import namedtuple
 from collections.abc import Mapping
 from copy import copy
+from operator import length_hint
 from weakref import ref
 
 from ._abc import BidirectionalMapping
+from ._delegating import _DelegatingMixin
 from ._dup import ON_DUP_DEFAULT, RAISE, DROP_OLD, DROP_NEW
 from ._exc import (
     DuplicationError, KeyDuplicationError, ValueDuplicationError, KeyAndValueDuplicationError)
@@ -41,9 +42,17 @@ from ._sntl import _MISS, _NOOP
 from ._util import _iteritems_args_kw
 
 
-_DedupResult = namedtuple('_DedupResult', 'isdupkey isdupval invbyval fwdbykey')
-_WriteResult = namedtuple('_WriteResult', 'key val oldkey oldval')
-_NODUP = _DedupResult(False, False, _MISS, _MISS)
+# Dedup results are plain (isdupkey, isdupval, invbyval, fwdbykey) tuples, and write results are
+# plain (key, val, oldkey, oldval) tuples. These are created for every item written, and callers
+# only ever unpack them, so avoid the extra instantiation overhead of namedtuples.
+_NODUP = (False, False, _MISS, _MISS)
+
+
+def _copy_backing(mapping):
+    """Return a shallow copy of the given backing mapping."""
+    # Call dict.copy directly in the common case of a dict backing mapping,
+    # skipping the dispatch that the copy module performs.
+    return mapping.copy() if mapping.__class__ is dict else copy(mapping)
 
 
 # Since BidirectionalMapping implements __subclasshook__, and BidictBase
@@ -57,7 +66,7 @@ _NODUP = _DedupResult(False, False, _MISS, _MISS)
 class BidictBase(BidirectionalMapping):
     """Base class implementing :class:`BidirectionalMapping`."""
 
-    __slots__ = ('_fwdm', '_invm', '_inv', '_invweak', '_hash', '__weakref__')
+    __slots__ = ('_fwdm', '_invm', '_inv', '_hash', '__weakref__')
 
     #: The default :class:`~bidict.OnDup`
     #: that governs behavior when a provided item
@@ -89,40 +98,51 @@ class BidictBase(BidirectionalMapping):
             self._update(True, self.on_dup, *args, **kw)
 
     def _init_inv(self):
+        # The inverse bidict is only created the first time it's requested, by :attr:`inverse`
+        # (see :meth:`_materialize_inv`), so many bidicts whose inverses are never used are cheaper.
+        self._inv = None
+
+    def _materialize_inv(self):
         # Compute the type for this bidict's inverse bidict (will be different from this
         # bidict's type if _fwdm_cls and _invm_cls are different).
         inv_cls = self._inv_cls()
         # Create the inverse bidict instance via __new__, bypassing its __init__ so that its
-        # _fwdm and _invm can be assigned to this bidict's _invm and _fwdm. Store it in self._inv,
-        # which holds a strong reference to a bidict's inverse, if one is available.
+        # _fwdm and _invm can be assigned to this bidict's _invm and _fwdm. Store a strong reference
+        # to it in self._inv.
         self._inv = inv = inv_cls.__new__(inv_cls)
         inv._fwdm = self._invm  # pylint: disable=protected-access
         inv._invm = self._fwdm  # pylint: disable=protected-access
         # Only give the inverse a weak reference to this bidict to avoid creating a reference cycle,
-        # stored in the _invweak attribute. See also the docs in
-        # :ref:`addendum:Bidict Avoids Reference Cycles`
-        inv._inv = None  # pylint: disable=protected-access
-        inv._invweak = ref(self)  # pylint: disable=protected-access
-        # Since this bidict has a strong reference to its inverse already, set its _invweak to None.
-        self._invweak = None
+        # stored in its _inv attribute (one slot holds either kind of reference, to keep instances
+        # small). See also the docs in :ref:`addendum:Bidict Avoids Reference Cycles`
+        inv._inv = ref(self)  # pylint: disable=protected-access
+        return inv
 
     @classmethod
     def _inv_cls(cls):
         """The inverse of this bidict type, i.e. one with *_fwdm_cls* and *_invm_cls* swapped."""
+        # The result is cached in cls's own namespace the first time it's computed (i.e. the first
+        # time an inverse of a cls instance is created), and only looked up there on later calls,
+        # since a base class's cached inverse is not cls's inverse.
+        inv_cls = cls.__dict__.get('_inv_cls_')
+        if inv_cls:
+            return inv_cls
         if cls._fwdm_cls is cls._invm_cls:
-            return cls
-        if not getattr(cls, '_inv_cls_', None):
+            inv_cls = cls
+        else:
             class _Inv(cls):
                 _fwdm_cls = cls._invm_cls
                 _invm_cls = cls._fwdm_cls
                 _inv_cls_ = cls
             _Inv.__name__ = cls.__name__ + 'Inv'
-            cls._inv_cls_ = _Inv
-        return cls._inv_cls_
+            inv_cls = _Inv
+        cls._inv_cls_ = inv_cls
+        return inv_cls
 
     @property
     def _isinv(self):
-        return self._inv is None
+        # Only an inverse created by _materialize_inv holds a weak reference to its inverse.
+        return self._inv.__class__ is ref
 
     @property
     def inverse(self):
@@ -131,16 +151,16 @@ class BidictBase(BidirectionalMapping):
         *See also* :attr:`inv`
         """
         # Resolve and return a strong reference to the inverse bidict.
-        # One may be stored in self._inv already.
-        if self._inv is not None:
-            return self._inv
-        # Otherwise a weakref is stored in self._invweak. Try to get a strong ref from it.
-        inv = self._invweak()  # pylint: disable=not-callable
+        # self._inv holds either a strong reference to it, a weakref to it, or None.
+        inv = self._inv
+        if inv.__class__ is ref:
+            # Try to get a strong ref from the weakref.
+            inv = inv()
         if inv is not None:
             return inv
-        # Refcount of referent must have dropped to zero, as in `bidict().inv.inv`. Init a new one.
-        self._init_inv()  # Now this bidict will retain a strong ref to its inverse.
-        return self._inv
+        # Either the inverse was never requested before, or the refcount of the referent must have
+        # dropped to zero, as in `bidict().inv.inv`. Create a new one.
+        return self._materialize_inv()  # Now this bidict will retain a strong ref to its inverse.
 
     @property
     def inv(self):
@@ -159,7 +179,9 @@ class BidictBase(BidirectionalMapping):
                 if hasattr(self, slot):
                     state[slot] = getattr(self, slot)
         # weakrefs can't be pickled.
-        state.pop('_invweak', None)  # Added back in __setstate__ via _init_inv call.
+        state.pop('_inv', None)  # Reset in __setstate__ via _init_inv call. Recreated lazily.
+        # A cached hash may not be valid in another process (e.g. with different string hashing).
+        state.pop('_hash', None)  # Recomputed on demand.
         state.pop('__weakref__', None)  # Not added back in __setstate__. Python manages this one.
         return state
 
@@ -198,8 +220,19 @@ class BidictBase(BidirectionalMapping):
         """
         if not isinstance(other, Mapping) or len(self) != len(other):
             return False
+        # An explicit loop avoids the per-item generator overhead of all(<genexpr>).
         selfget = self.get
-        return all(selfget(k, _MISS) == v for (k, v) in other.items())
+        for (key, val) in other.items():
+            if not selfget(key, _MISS) == val:  # pylint: disable=unneeded-not
+                return False
+        return True
+
+    def __ne__(self, other):
+        """*x.__ne__(other)　⟺　x != other*"""
+        # The default object.__ne__ would also negate the result of __eq__, but calling __eq__
+        # directly from here avoids the slower generic special method dispatch that it goes through.
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
     # The following methods are mutating and so are not public. But they are implemented in this
     # non-mutable base class (rather than the mutable `bidict` subclass) because they are used here
@@ -232,45 +265,50 @@ class BidictBase(BidirectionalMapping):
         If duplication is found and the corresponding :class:`~bidict.OnDupAction` is
         :attr:`~bidict.DROP_OLD`,
         or if no duplication is found,
-        return the :class:`_DedupResult` *(isdupkey, isdupval, oldkey, oldval)*.
+        return the dedup result tuple *(isdupkey, isdupval, oldkey, oldval)*.
         """
         fwdm = self._fwdm
         invm = self._invm
+        # Membership tests are cheaper than get calls, so use them to detect the common case:
+        # neither key nor val is a duplicate -> skip the lookups and all the branching below.
+        if key not in fwdm and val not in invm:
+            return _NODUP
         oldval = fwdm.get(key, _MISS)
         oldkey = invm.get(val, _MISS)
         isdupkey = oldval is not _MISS
         isdupval = oldkey is not _MISS
-        dedup_result = _DedupResult(isdupkey, isdupval, oldkey, oldval)
         if isdupkey and isdupval:
             if self._already_have(key, val, oldkey, oldval):
                 # (key, val) duplicates an existing item -> no-op.
                 return _NOOP
             # key and val each duplicate a different existing item.
-            if on_dup.kv is RAISE:
+            action = on_dup.kv
+            if action is RAISE:
                 raise KeyAndValueDuplicationError(key, val)
-            if on_dup.kv is DROP_NEW:
+            if action is DROP_NEW:
                 return _NOOP
-            if on_dup.kv is not DROP_OLD:  # pragma: no cover
-                raise ValueError(on_dup.kv)
+            if action is not DROP_OLD:  # pragma: no cover
+                raise ValueError(action)
             # Fall through to the return statement on the last line.
         elif isdupkey:
-            if on_dup.key is RAISE:
+            action = on_dup.key
+            if action is RAISE:
                 raise KeyDuplicationError(key)
-            if on_dup.key is DROP_NEW:
+            if action is DROP_NEW:
                 return _NOOP
-            if on_dup.key is not DROP_OLD:  # pragma: no cover
-                raise ValueError(on_dup.key)
+            if action is not DROP_OLD:  # pragma: no cover
+                raise ValueError(action)
             # Fall through to the return statement on the last line.
-        elif isdupval:
-            if on_dup.val is RAISE:
+        else:  # isdupval
+            action = on_dup.val
+            if action is RAISE:
                 raise ValueDuplicationError(val)
-            if on_dup.val is DROP_NEW:
+            if action is DROP_NEW:
                 return _NOOP
-            if on_dup.val is not DROP_OLD:  # pragma: no cover
-                raise ValueError(on_dup.val)
+            if action is not DROP_OLD:  # pragma: no cover
+                raise ValueError(action)
             # Fall through to the return statement on the last line.
-        # else neither isdupkey nor isdupval.
-        return dedup_result
+        return isdupkey, isdupval, oldkey, oldval
 
     @staticmethod
     def _already_have(key, val, oldkey, oldval):
@@ -281,67 +319,179 @@ class BidictBase(BidirectionalMapping):
 
     def _write_item(self, key, val, dedup_result):
         # Overridden by _orderedbase.OrderedBidictBase.
-        isdupkey, isdupval, oldkey, oldval = dedup_result
         fwdm = self._fwdm
         invm = self._invm
         fwdm[key] = val
         invm[val] = key
+        if dedup_result is _NODUP:
+            return key, val, _MISS, _MISS
+        isdupkey, isdupval, oldkey, oldval = dedup_result
         if isdupkey:
             del invm[oldval]
         if isdupval:
             del fwdm[oldkey]
-        return _WriteResult(key, val, oldkey, oldval)
+        return key, val, oldkey, oldval
 
     def _update(self, init, on_dup, *args, **kw):
         # args[0] may be a generator that yields many items, so process input in a single pass.
         if not args and not kw:
             return
-        can_skip_dup_check = not self and not kw and isinstance(args[0], BidirectionalMapping)
-        if can_skip_dup_check:
-            self._update_no_dup_check(args[0])
-            return
+        # The fast paths below only apply when given a single positional argument and no kw.
+        # (Leave _iteritems_args_kw to raise if given more than one positional argument.)
+        arg = args[0] if len(args) == 1 and not kw else None
+        if not self:
+            if isinstance(arg, BidirectionalMapping):
+                self._update_no_dup_check(arg)
+                return
+            # Of Mappings, only bulk-insert an exact dict. dict.update reads a dict subclass's items
+            # directly, so they could differ from what its items() gives, and any other Mapping is
+            # cheaper to insert item-by-item.
+            if arg.__class__ is dict and self._try_update_no_dup_check(arg):
+                return
+        if isinstance(arg, Mapping):
+            # Iterate over the Mapping's items directly.
+            items = arg.items()
+        elif arg:
+            # Otherwise arg must be an iterable of pairs, which can also be iterated directly.
+            items = arg
+        else:
+            items = _iteritems_args_kw(*args, **kw)
         can_skip_rollback = init or RAISE not in on_dup
         if can_skip_rollback:
-            self._update_no_rollback(on_dup, *args, **kw)
+            self._update_no_rollback(on_dup, items)
         else:
-            self._update_with_rollback(on_dup, *args, **kw)
+            self._update_with_rollback(on_dup, items)
 
     def _update_no_dup_check(self, other):
+        # Overridden by _orderedbase.OrderedBidictBase.
+        # No item can cause duplication, so nothing will need to be deleted from the backing
+        # mappings -> bulk-insert the items via their update methods rather than item-by-item.
+        if isinstance(other, _DelegatingMixin):
+            # other's backing mappings store its items directly, so pass them to update as-is.
+            # When both sides are dicts, this lets dict.update size the target once up front
+            # (rather than growing it incrementally as items are added).
+            fwd = other._fwdm  # pylint: disable=protected-access
+            inv = other._invm  # pylint: disable=protected-access
+        else:
+            fwd = other.items()
+            inv = other.inverse.items()
+        self._fwdm.update(fwd)
+        self._invm.update(inv)
+
+    def _try_update_no_dup_check(self, arg):
+        """Try to insert the items in the :class:`dict` *arg* into (empty) self
+        without checking each for duplication.
+
+        Return True if this succeeded, i.e. no two of the items shared a value.
+        Otherwise leave self empty and return False, so the caller can fall back to
+        the item-by-item path, which handles any duplication as per *on_dup*.
+        """
+        # Overridden by _orderedbase.OrderedBidictBase.
+        fwdm = self._fwdm
+        invm = self._invm
+        try:
+            fwdm.update(arg)
+            invm.update([(val, key) for (key, val) in arg.items()])
+        except TypeError:
+            # e.g. an unhashable value. The item-by-item path will raise the error
+            # after writing the items before the offending one, just as it would have otherwise.
+            pass
+        else:
+            # No value was repeated iff the inverse mapping got one entry per item.
+            if len(invm) == len(arg):
+                return True
+        fwdm.clear()
+        invm.clear()
+        return False
+
+    def _update_no_rollback(self, on_dup, items):
+        # Overridden by _orderedbase.OrderedBidictBase.
+        # This is the hot path for most bulk updates, so inline the common case of an item that
+        # duplicates nothing, which then needs no calls to _dedup_item or _write_item at all.
+        invm = self._invm
+        fwdsetdefault = self._fwdm.setdefault
+        dedup_item = self._dedup_item
         write_item = self._write_item
-        for (key, val) in other.items():
-            write_item(key, val, _NODUP)
-
-    def _update_no_rollback(self, on_dup, *args, **kw):
-        put = self._put
-        for (key, val) in _iteritems_args_kw(*args, **kw):
-            put(key, val, on_dup)
+        for (key, val) in items:
+            # Once val is known not to be a duplicate, setdefault inserts key unless it's a
+            # duplicate, in one lookup (rather than a membership test followed by an assignment),
+            # which saves rehashing key. (If key already mapped to val, val would be in invm.)
+            if val not in invm and fwdsetdefault(key, val) is val:
+                invm[val] = key
+                continue
+            # Some duplication -> defer to _dedup_item to handle it as per on_dup.
+            dedup_result = dedup_item(key, val, on_dup)
+            if dedup_result is not _NOOP:
+                write_item(key, val, dedup_result)
 
-    def _update_with_rollback(self, on_dup, *args, **kw):
+    def _update_with_rollback(self, on_dup, items):
         """Update, rolling back on failure."""
+        # Overridden by _orderedbase.OrderedBidictBase.
+        # Rolling back by undoing each write requires logging each write as it's made. When there
+        # are (likely) more items to write than there are items in self already, it's cheaper to
+        # snapshot the backing mappings up front and restore them from the snapshot on failure.
+        fwdm = self._fwdm
+        invm = self._invm
+        if not fwdm:
+            # Nothing to snapshot: rolling back just means emptying the backing mappings again.
+            # This holds regardless of how many items there are, even if that's not known up front.
+            try:
+                self._update_no_rollback(on_dup, items)
+            except DuplicationError:
+                fwdm.clear()
+                invm.clear()
+                raise
+            return
+        if length_hint(items) <= len(fwdm):
+            self._update_with_writelog(on_dup, items)
+            return
+        fwdm_bak = _copy_backing(fwdm)
+        invm_bak = _copy_backing(invm)
+        try:
+            self._update_no_rollback(on_dup, items)
+        except DuplicationError:
+            # Restore in place (rather than rebinding self._fwdm and self._invm to the snapshots),
+            # so that self's inverse and any views of the backing mappings remain valid.
+            fwdm.clear()
+            fwdm.update(fwdm_bak)
+            invm.clear()
+            invm.update(invm_bak)
+            raise
+
+    def _update_with_writelog(self, on_dup, items):
+        """Update, rolling back on failure by undoing each logged write."""
+        # Log each write's dedup result and write result as consecutive entries in a flat list,
+        # rather than allocating a (dedup_result, write_result) pair for every write.
         writelog = []
         appendlog = writelog.append
         dedup_item = self._dedup_item
         write_item = self._write_item
-        for (key, val) in _iteritems_args_kw(*args, **kw):
+        for (key, val) in items:
             try:
                 dedup_result = dedup_item(key, val, on_dup)
             except DuplicationError:
                 undo_write = self._undo_write
-                for dedup_result, write_result in reversed(writelog):
+                revlog = reversed(writelog)
+                for write_result, dedup_result in zip(revlog, revlog):
                     undo_write(dedup_result, write_result)
                 raise
             if dedup_result is not _NOOP:
                 write_result = write_item(key, val, dedup_result)
-                appendlog((dedup_result, write_result))
+                appendlog(dedup_result)
+                appendlog(write_result)
 
     def _undo_write(self, dedup_result, write_result):
-        isdupkey, isdupval, _, _ = dedup_result
+        # Overridden by _orderedbase.OrderedBidictBase.
         key, val, oldkey, oldval = write_result
-        if not isdupkey and not isdupval:
-            self._pop(key)
-            return
         fwdm = self._fwdm
         invm = self._invm
+        if dedup_result is _NODUP:
+            # Both key and val are known to be present, so delete them directly
+            # rather than going through _pop (which would have to look up val first).
+            del fwdm[key]
+            del invm[val]
+            return
+        isdupkey, isdupval, _, _ = dedup_result
         if isdupkey:
             fwdm[key] = oldval
             invm[oldval] = key
@@ -359,11 +509,12 @@ class BidictBase(BidirectionalMapping):
         # __new__ to create a copy instance while bypassing its __init__, which would result
         # in copying this bidict's items into the copy instance one at a time. Instead, make whole
         # copies of each of the backing mappings, and make them the backing mappings of the copy,
-        # avoiding copying items one at a time.
+        # avoiding copying items one at a time. The copy's inverse is created lazily, as usual,
+        # so just null out its inverse reference here rather than calling _init_inv.
         cp = self.__class__.__new__(self.__class__)  # pylint: disable=invalid-name
-        cp._fwdm = copy(self._fwdm)  # pylint: disable=protected-access
-        cp._invm = copy(self._invm)  # pylint: disable=protected-access
-        cp._init_inv()  # pylint: disable=protected-access
+        cp._fwdm = _copy_backing(self._fwdm)  # pylint: disable=protected-access
+        cp._invm = _copy_backing(self._invm)  # pylint: disable=protected-access
+        cp._inv = None  # pylint: disable=protected-access
         return cp
 
     def __copy__(self):
@@ -377,6 +528,11 @@ class BidictBase(BidirectionalMapping):
         """The number of contained items."""
         return len(self._fwdm)
 
+    def __contains__(self, key):
+        """True if the mapping contains the specified key, else False."""
+        # Overrides Mapping.__contains__, which calls __getitem__ and catches KeyError on a miss.
+        return key in self._fwdm
+
     def __iter__(self):  # lgtm [py/inheritance/incorrect-overridden-signature]
         """Iterator over the contained keys."""
         # No default implementation for __iter__ inherited from Mapping ->
@@ -17,10 +17,37 @@ class _DelegatingMixin:
 
     __slots__ = ()
 
+    def __repr__(self):
+        """See :func:`repr`."""
+        fwdm = self._fwdm  # pylint: disable=protected-access
+        delegate = self._repr_delegate  # pylint: disable=no-member
+        # When the items would just be copied into an identical dict to be printed,
+        # print the backing dict itself instead.
+        if fwdm and fwdm.__class__ is dict and delegate is dict:
+            return '%s(%r)' % (self.__class__.__name__, fwdm)
+        return super().__repr__()
+
+    def __eq__(self, other):
+        """*x.__eq__(other)　⟺　x == other*
+
+        When *other* is a :class:`dict` or another bidict with directly-stored items,
+        compare the backing forward mappings (e.g. via :meth:`dict.__eq__`).
+        Otherwise fall back to the inherited implementation.
+        """
+        if isinstance(other, _DelegatingMixin):
+            return self._fwdm == other._fwdm  # pylint: disable=protected-access
+        if other.__class__ is dict:
+            return self._fwdm == other  # pylint: disable=protected-access
+        return super().__eq__(other)
+
     def __iter__(self):
         """Iterator over the contained keys."""
         return iter(self._fwdm)  # pylint: disable=protected-access
 
+    def get(self, key, default=None):
+        """The value for *key* if *key* is present, else *default*."""
+        return self._fwdm.get(key, default)  # pylint: disable=protected-access
+
     def keys(self):
         """A set-like object providing a view on the contained keys."""
         return self._fwdm.keys()  # pylint: disable=protected-access
@@ -32,9 +32,9 @@ from collections.abc import Mapping
 from copy import copy
 from weakref import ref
 
-from ._base import _WriteResult, BidictBase
+from ._base import _NODUP, BidictBase
 from ._bidict import bidict
-from ._sntl import _MISS
+from ._sntl import _MISS, _NOOP
 
 
 class _Node:  # pylint: disable=too-few-public-methods
@@ -160,9 +160,10 @@ class OrderedBidictBase(BidictBase):
         # are inherited and are able to be reused without modification.
         super().__init__(*args, **kw)
 
-    def _init_inv(self):
-        super()._init_inv()
-        self.inverse._sntl = self._sntl  # pylint: disable=protected-access
+    def _materialize_inv(self):
+        inv = super()._materialize_inv()
+        inv._sntl = self._sntl  # pylint: disable=protected-access
+        return inv
 
     # Can't reuse BidictBase.copy since ordered bidicts have different internal structure.
     def copy(self):
@@ -182,7 +183,7 @@ class OrderedBidictBase(BidictBase):
         cp._sntl = sntl  # pylint: disable=protected-access
         cp._fwdm = fwdm  # pylint: disable=protected-access
         cp._invm = invm  # pylint: disable=protected-access
-        cp._init_inv()  # pylint: disable=protected-access
+        cp._inv = None  # pylint: disable=protected-access
         return cp
 
     def __getitem__(self, key):
@@ -245,7 +246,7 @@ class OrderedBidictBase(BidictBase):
             oldnodefwd = fwdm.pop(oldkey)
             assert oldnodefwd is nodeinv
             fwdm[key] = nodeinv
-        return _WriteResult(key, val, oldkey, oldval)
+        return key, val, oldkey, oldval
 
     def _undo_write(self, dedup_result, write_result):  # pylint: disable=too-many-locals
         fwdm = self._fwdm
@@ -270,6 +271,29 @@ class OrderedBidictBase(BidictBase):
             fwdm[oldkey] = nodeinv
             assert invm[val] is nodeinv
 
+    def _update_no_rollback(self, on_dup, items):
+        # Overrides _base.BidictBase, whose inlined writes would bypass the nodes.
+        dedup_item = self._dedup_item
+        write_item = self._write_item
+        for (key, val) in items:
+            dedup_result = dedup_item(key, val, on_dup)
+            if dedup_result is not _NOOP:
+                write_item(key, val, dedup_result)
+
+    # Snapshotting the backing mappings wouldn't capture the order of the nodes,
+    # so always roll back a failed update by undoing each write.
+    _update_with_rollback = BidictBase._update_with_writelog
+
+    def _try_update_no_dup_check(self, arg):
+        # Overrides _base.BidictBase. Each item needs its own node, so can't bulk-insert items.
+        return False
+
+    def _update_no_dup_check(self, other):
+        # Overrides _base.BidictBase. Each item needs its own node, so must write item-by-item.
+        write_item = self._write_item
+        for (key, val) in other.items():
+            write_item(key, val, _NODUP)
+
     def __iter__(self, reverse=False):
         """Iterator over the contained keys in insertion order."""
         fwdm_inv = self._fwdm.inverse  # pylint: disable=no-member
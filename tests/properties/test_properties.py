@@ -221,6 +221,18 @@ def test_frozenbidicts_hashable(bi):
     {bi: bi}
 
 
+@given(st.FROZEN_BIDICTS)
+def test_frozenbidict_hash_not_pickled(bi):
+    """A frozen bidict's cached hash should not be pickled,
+    since it may not be valid in another process (e.g. with different string hashing),
+    but the unpickled bidict should hash equal.
+    """
+    hashed = hash(bi)
+    assert '_hash' not in bi.__getstate__()
+    roundtripped = pickle.loads(pickle.dumps(bi))
+    assert hash(roundtripped) == hashed
+
+
 @given(st.NAMEDBIDICT_NAMES_SOME_INVALID)
 def test_namedbidict_raises_on_invalid_name(names):
     """:func:`bidict.namedbidict` should raise if given invalid names."""
@@ -277,7 +289,7 @@ def test_bidict_isinv_getstate(bi):
 @given(bi_cls=st.BIDICT_TYPES)
 def test_refcycle_bidict_inverse(bi_cls):
     """When you release your last strong reference to a bidict,
-    there are no remaining strong references to it
+    there are no remaining strong references to it or its inverse
     (e.g. no reference cycle was created between it and its inverse)
     allowing the memory to be reclaimed immediately.
     """
@@ -285,9 +297,12 @@ def test_refcycle_bidict_inverse(bi_cls):
     try:
         bi = bi_cls()
         weak = ref(bi)
+        weak_inv = ref(bi.inverse)  # Inverses are created lazily, so make sure this one exists.
         assert weak() is not None
+        assert weak_inv() is not None
         del bi
         assert weak() is None
+        assert weak_inv() is None
     finally:
         gc.enable()
 
@@ -334,6 +349,54 @@ def test_inv_aliases_inverse(bi):
     assert bi.inv.inverse is bi.inverse.inv
 
 
+@given(bi_cls=st.BIDICT_TYPES, init_items=st.I_PAIRS_NODUP)
+def test_inverse_created_lazily(bi_cls, init_items):
+    """A bidict's inverse should not be created until it's first requested,
+    including for a copy or an unpickled bidict,
+    even if the original bidict's inverse was already created.
+    """
+    # pylint: disable=protected-access
+    bi = bi_cls(init_items)
+    assert bi._inv is None
+    copied_before = [bi.copy(), pickle.loads(pickle.dumps(bi))]
+    bi.inverse  # pylint: disable=pointless-statement
+    copied_after = [bi.copy(), pickle.loads(pickle.dumps(bi))]
+    for copied in copied_before + copied_after:
+        assert copied._inv is None
+    for bi_ in [bi] + copied_before + copied_after:
+        inv = bi_.inverse
+        assert bi_._inv is inv
+        assert inv.inv is bi_
+        assert not bi_._isinv
+        assert inv._isinv
+
+
+# See comment about skipping `test_refcycle_bidict_inverse` above.
+@pytest.mark.skipif(PYPY, reason='objects with 0 refcount are not freed immediately on PyPy')
+@given(nb_cls=st.NAMEDBIDICT_TYPES, init_items=st.I_PAIRS_NODUP)
+def test_namedbidict_inverse_recreated(nb_cls, init_items):
+    """After the last strong reference to a namedbidict is released,
+    its inverse should be able to create a new inverse of its own,
+    and the custom accessors of both should remain consistent.
+    """
+    # pylint: disable=protected-access
+    gc.disable()
+    try:
+        inv = nb_cls(init_items).inv
+        assert inv._isinv
+        assert inv._inv() is None  # The weakref to the original namedbidict is now dead.
+        inv_inv = inv.inv
+        assert inv_inv.inv is inv
+        assert inv.inv is inv_inv
+    finally:
+        gc.enable()
+    assert inv._isinv != inv_inv._isinv
+    fwd, rev = (inv_inv, inv) if inv._isinv else (inv, inv_inv)
+    for nb in (inv, inv_inv):
+        assert getattr(nb, fwd._valname + '_for') is fwd
+        assert getattr(nb, fwd._keyname + '_for') is rev
+
+
 @given(st.BIDICTS)
 def test_pickle_roundtrips(bi):
     """A bidict should equal the result of unpickling its pickle."""
@@ -11,7 +11,9 @@ from collections.abc import Hashable, Mapping, MutableMapping
 
 import pytest
 
-from bidict import bidict, frozenbidict, FrozenOrderedBidict, OrderedBidict, BidirectionalMapping
+from bidict import (
+    bidict, frozenbidict, namedbidict, FrozenOrderedBidict, OrderedBidict, BidirectionalMapping,
+)
 
 
 class VirtualBimapSubclass(Mapping):  # pylint: disable=abstract-method
@@ -42,6 +44,26 @@ class AbstractBimap(BidirectionalMapping):  # pylint: disable=abstract-method
     __len__ = NotImplemented
 
 
+class _FwdmDict(dict):
+    """Dummy dict subclass used as the forward backing mapping of :class:`AsymmetricBidict`."""
+
+
+class AsymmetricBidict(bidict):  # pylint: disable=too-many-ancestors
+    """Dummy bidict type whose *_fwdm_cls* differs from its *_invm_cls*,
+    so that its inverse type has to be computed (see :meth:`BidictBase._inv_cls`).
+    """
+
+    _fwdm_cls = _FwdmDict
+
+
+class AsymmetricBidictSub(AsymmetricBidict):  # pylint: disable=too-many-ancestors
+    """Dummy subclass of :class:`AsymmetricBidict` that inherits its backing mapping types."""
+
+
+class SymmetricBidictSub(bidict):  # pylint: disable=too-many-ancestors
+    """Dummy bidict subclass whose *_fwdm_cls* and *_invm_cls* are the same."""
+
+
 BIDICT_TYPES = (bidict, frozenbidict, FrozenOrderedBidict, OrderedBidict)
 BIMAP_TYPES = BIDICT_TYPES + (VirtualBimapSubclass, AbstractBimap)
 NOT_BIMAP_TYPES = (dict, object)
@@ -116,6 +138,34 @@ def test_issubclass_internal():
     assert not issubclass(frozenbidict, bidict)
 
 
+def test_inv_cls_of_subclass():
+    """A subclass of an asymmetric bidict type should get its own inverse type,
+    not the inverse type of its base class.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    sub = AsymmetricBidictSub()
+    assert type(sub.inv.inv) is AsymmetricBidictSub
+    assert issubclass(type(sub.inv), AsymmetricBidictSub)
+    assert type(sub.inv) is not type(AsymmetricBidict().inv)
+
+
+def test_inv_cls_of_symmetric_subclass():
+    """A subclass of a symmetric bidict type should be its own inverse type,
+    even after its base class's inverse type has been computed (and cached).
+    """
+    # pylint: disable=unidiomatic-typecheck
+    assert type(bidict().inv) is bidict
+    assert type(SymmetricBidictSub().inv) is SymmetricBidictSub
+
+
+def test_named_asymmetric_inv_cls_name():
+    """The inverse type of a namedbidict type should be named after the namedbidict type."""
+    elements_cls = namedbidict('Elements', 'sym', 'name', base_type=AsymmetricBidict)
+    elements = elements_cls({'H': 'hydrogen'})
+    assert type(elements.inv).__name__ == 'ElementsInv'
+    assert repr(elements.inv) == "ElementsInv({'hydrogen': 'H'})"
+
+
 def test_abstract_bimap_init_fails():
     """See the :class:`AbstractBimap` docstring above."""
     with pytest.raises(TypeError):